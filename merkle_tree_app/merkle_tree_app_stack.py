@@ -56,6 +56,17 @@ class MerkleTreeAppStack(Stack):
                                              'DATA_TABLE_NAME': data_table.table_name
                                          })
 
+        lambda_create_batch = _lambda.Function(self,
+                                               id='MerkleTreeCreateBatchLambdaFunction',
+                                               runtime=_lambda.Runtime.PYTHON_3_9,
+                                               code=_lambda.Code.from_asset(lambda_src_path),
+                                               handler='lambda_handler.handle_create_batch',
+                                               timeout=Duration.seconds(LAMBDA_TIMEOUT_SEC),
+                                               environment={
+                                                   'TREE_BUCKET_NAME': tree_bucket.bucket_name,
+                                                   'DATA_TABLE_NAME': data_table.table_name
+                                               })
+
         api = _apigateway.RestApi(self, 'MerkleTreeAppAPI', rest_api_name='merkle_app_api')
 
         # '/retrieve' API to fetch response about the node in the index
@@ -66,11 +77,17 @@ class MerkleTreeAppStack(Stack):
         create_api_integration = _apigateway.LambdaIntegration(lambda_create)
         api.root.add_resource('tree').add_method('POST', create_api_integration)
 
+        # '/trees' API to create multiple trees in a single request
+        create_batch_api_integration = _apigateway.LambdaIntegration(lambda_create_batch)
+        api.root.add_resource('trees').add_method('POST', create_batch_api_integration)
+
         tree_bucket.grant_read(lambda_index)
         tree_bucket.grant_write(lambda_create)
+        tree_bucket.grant_write(lambda_create_batch)
 
         data_table.grant_read_data(lambda_index)
         data_table.grant_write_data(lambda_create)
+        data_table.grant_write_data(lambda_create_batch)
 
         # Output the API Gateway URL
         CfnOutput(
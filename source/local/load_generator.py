@@ -0,0 +1,212 @@
+"""
+Replays a mixed create/retrieve workload against the API at a target rate and reports throughput and latency.
+
+Usage (from the repository root, with the local server or a deployed stack running):
+    python -m source.local.load_generator --url http://127.0.0.1:8000 --qps 50 --duration 30
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+
+class LatencyStats:
+    """
+    Thread-safe collection of request latencies and errors for each operation.
+    """
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def record(self, operation: str, latency_sec: float, success: bool):
+        with self.lock:
+            self.latencies.setdefault(operation, []).append(latency_sec)
+            if not success:
+                self.errors[operation] = self.errors.get(operation, 0) + 1
+
+    @staticmethod
+    def percentile(sorted_values: List[float], percent: float) -> float:
+        """
+        Nearest-rank percentile of the given sorted values.
+        """
+        rank = math.ceil(percent / 100 * len(sorted_values))
+        return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+    def report(self, elapsed_sec: float) -> str:
+        """
+        :param elapsed_sec: Wall clock duration of the run
+        :return: Table of count, errors, throughput and latency percentiles for each operation.
+        """
+        header = f"{'operation':<12}{'count':>8}{'errors':>8}{'req/s':>10}" \
+                 f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+        lines = [header]
+        with self.lock:
+            all_latencies = [latency for latencies in self.latencies.values() for latency in latencies]
+            rows = sorted(self.latencies.items()) + [('total', all_latencies)]
+            for operation, latencies in rows:
+                if len(latencies) == 0:
+                    continue
+                values = sorted(latencies)
+                errors = sum(self.errors.values()) if operation == 'total' else self.errors.get(operation, 0)
+                lines.append(f"{operation:<12}{len(values):>8}{errors:>8}{len(values) / elapsed_sec:>10.1f}"
+                             f"{self.percentile(values, 50) * 1000:>10.1f}"
+                             f"{self.percentile(values, 90) * 1000:>10.1f}"
+                             f"{self.percentile(values, 99) * 1000:>10.1f}"
+                             f"{values[-1] * 1000:>10.1f}")
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """
+    Sends requests at a fixed rate regardless of how fast responses come back (open loop), so a slow server
+    shows up as higher latency instead of a lower request rate. Latency is measured from the time a request
+    was scheduled to be sent.
+    """
+
+    def __init__(self, url: str, qps: float, duration_sec: float, create_ratio: float, batch_ratio: float,
+                 batch_size: int, leaves: int, leaf_pool: int, workers: int, timeout_sec: float):
+        self.url = url.rstrip('/')
+        self.qps = qps
+        self.duration_sec = duration_sec
+        self.create_ratio = create_ratio
+        self.batch_ratio = batch_ratio
+        self.batch_size = batch_size
+        self.leaves = leaves
+        self.leaf_pool = leaf_pool
+        self.workers = workers
+        self.timeout_sec = timeout_sec
+        self.stats = LatencyStats()
+        # Number of requests sent by the last run, excluding the seeding request.
+        self.sent = 0
+        # (tree_id, number of leaves) of the created trees, used to build retrieve requests.
+        self.trees: List[Tuple[str, int]] = []
+        self.trees_lock = threading.Lock()
+
+    def random_data(self) -> List[str]:
+        # Draw leaves from a shared pool, so that trees share leaves the same as in real ingestion
+        return [str(random.randrange(self.leaf_pool)) for _ in range(random.randint(1, self.leaves))]
+
+    def add_tree(self, tree_id: str, data: List[str]):
+        with self.trees_lock:
+            self.trees.append((tree_id, len(set(data))))
+
+    def random_tree(self) -> Optional[Tuple[str, int]]:
+        with self.trees_lock:
+            return random.choice(self.trees) if len(self.trees) > 0 else None
+
+    def post(self, path: str, payload: Dict) -> Tuple[bool, Dict]:
+        request = urllib.request.Request(f"{self.url}{path}",
+                                         data=json.dumps(payload).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'},
+                                         method='POST')
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout_sec) as response:
+                return True, json.loads(response.read())
+        except (urllib.error.URLError, OSError, ValueError) as err:
+            print(f"Request to {path} failed: {err}")
+            return False, {}
+
+    def create(self) -> bool:
+        data = self.random_data()
+        success, response = self.post('/tree', {'data': data})
+        if success:
+            self.add_tree(response['tree_id'], data)
+        return success
+
+    def create_batch(self) -> bool:
+        datasets = [self.random_data() for _ in range(self.batch_size)]
+        success, response = self.post('/trees', {'datasets': datasets})
+        if not success:
+            return False
+        for data, tree in zip(datasets, response['trees']):
+            if 'tree_id' not in tree:
+                return False
+            self.add_tree(tree['tree_id'], data)
+        return True
+
+    def retrieve(self) -> bool:
+        tree_id, leaves = self.random_tree()
+        # A tree with n unique leaves has at least 2n - 1 nodes, so this index is always within bounds
+        index = random.randrange(2 * leaves - 1)
+        success, _ = self.post('/retrieve', {'tree_id': tree_id, 'index': index})
+        return success
+
+    def pick_operation(self) -> str:
+        if self.random_tree() is None:
+            return 'create'
+        roll = random.random()
+        if roll < self.batch_ratio:
+            return 'create_batch'
+        if roll < self.batch_ratio + self.create_ratio:
+            return 'create'
+        return 'retrieve'
+
+    def send(self, operation: str, scheduled_at: float):
+        try:
+            success = getattr(self, operation)()
+        except Exception as e:
+            print(f"Unexpected error in {operation}: {e}")
+            success = False
+        self.stats.record(operation, time.perf_counter() - scheduled_at, success)
+
+    def run(self) -> float:
+        """
+        Sends requests at the target rate for the configured duration and waits for all of them to complete.
+        :return: Elapsed wall clock time in seconds.
+        """
+        # Seed a tree so the first retrieve requests have something to read
+        self.create()
+        self.stats = LatencyStats()
+
+        interval = 1.0 / self.qps
+        start = time.perf_counter()
+        self.sent = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                scheduled_at = start + self.sent * interval
+                if scheduled_at - start >= self.duration_sec:
+                    break
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self.send, self.pick_operation(), scheduled_at)
+                self.sent += 1
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a mixed create/retrieve workload against the API.")
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help="Base URL of the API")
+    parser.add_argument('--qps', type=float, default=20, help="Target requests per second")
+    parser.add_argument('--duration', type=float, default=10, help="Duration of the run in seconds")
+    parser.add_argument('--create-ratio', type=float, default=0.2, help="Fraction of /tree requests")
+    parser.add_argument('--batch-ratio', type=float, default=0.0, help="Fraction of /trees requests")
+    parser.add_argument('--batch-size', type=int, default=10, help="Number of trees per /trees request")
+    parser.add_argument('--leaves', type=int, default=16, help="Maximum number of leaves per tree")
+    parser.add_argument('--leaf-pool', type=int, default=1000, help="Number of distinct leaf values")
+    parser.add_argument('--workers', type=int, default=32, help="Maximum number of requests in flight")
+    parser.add_argument('--timeout', type=float, default=30, help="Request timeout in seconds")
+    args = parser.parse_args()
+
+    if args.qps <= 0:
+        parser.error("--qps must be positive.")
+    if args.create_ratio + args.batch_ratio > 1:
+        parser.error("--create-ratio and --batch-ratio must add up to at most 1.")
+
+    generator = LoadGenerator(args.url, args.qps, args.duration, args.create_ratio, args.batch_ratio,
+                              args.batch_size, args.leaves, args.leaf_pool, args.workers, args.timeout)
+    print(f"Sending {args.qps} requests per second to {args.url} for {args.duration} seconds")
+    elapsed_sec = generator.run()
+    print(generator.stats.report(elapsed_sec))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""
+Serves the Lambda handlers over HTTP locally, backed by stand-ins for S3 and DynamoDB.
+
+Usage (from the repository root):
+    python -m source.local.server --port 8000 [--data-dir /tmp/merkle-tree-data]
+"""
+import argparse
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from source.local.stores import DynamoDBResource, FileSystemS3Client, InMemoryS3Client
+
+LOCAL_TREE_BUCKET_NAME = 'local-merkle-tree-bucket'
+LOCAL_DATA_TABLE_NAME = 'MerkleTreeDataTable'
+
+lambda_src_path = Path(__file__).resolve().parent.parent / "src"
+
+
+def import_handlers():
+    """
+    Imports the Lambda source the same as in the Lambda runtime, where modules import their siblings as top level
+    modules.
+    :return: aws_client and lambda_handler modules.
+    """
+    if str(lambda_src_path) not in sys.path:
+        sys.path.insert(0, str(lambda_src_path))
+
+    # Region is only needed to create the real boto3 clients at import time, which are replaced by the server
+    region_was_set = 'AWS_DEFAULT_REGION' in os.environ
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
+    try:
+        import aws_client
+        import lambda_handler
+    finally:
+        if not region_was_set:
+            del os.environ['AWS_DEFAULT_REGION']
+    return aws_client, lambda_handler
+
+
+def create_stores(data_dir: Optional[Path] = None,
+                  unprocessed_keys_ratio: float = 0.0) -> Tuple[object, DynamoDBResource]:
+    """
+    Creates stand-ins for S3 and DynamoDB.
+    :param data_dir: Directory to persist trees and data in. Kept in memory if not given.
+    :param unprocessed_keys_ratio: Fraction of keys DynamoDB randomly returns as unprocessed.
+    :return: S3 client and DynamoDB resource stand-ins.
+    """
+    aws_client, _ = import_handlers()
+    key_name = aws_client.DDBClient.data_table_key
+
+    if data_dir is None:
+        return InMemoryS3Client(), DynamoDBResource(key_name, unprocessed_keys_ratio=unprocessed_keys_ratio)
+    return (FileSystemS3Client(data_dir / 's3'),
+            DynamoDBResource(key_name, data_dir / 'dynamodb', unprocessed_keys_ratio))
+
+
+def to_event(method: str, path: str, headers: Dict[str, str], body: str) -> Dict:
+    """
+    Maps an HTTP request to an API Gateway (REST API, Lambda proxy integration) event.
+    """
+    return {
+        'resource': path,
+        'path': path,
+        'httpMethod': method,
+        'headers': headers,
+        'queryStringParameters': None,
+        'pathParameters': None,
+        'isBase64Encoded': False,
+        'body': body,
+    }
+
+
+def make_handler(routes: Dict[str, Callable]):
+    """
+    Creates a request handler class dispatching POST requests to the given Lambda handlers.
+    """
+
+    class LambdaRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            # Always read the body, otherwise it is parsed as the next request on a kept alive connection
+            length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(length).decode('utf-8')
+
+            path = self.path.split('?', 1)[0].rstrip('/')
+            handler = routes.get(path)
+            if handler is None:
+                self.send_lambda_response({
+                    'statusCode': 404,
+                    'headers': {'Content-Type': 'text/plain'},
+                    'body': f'No route for: {path}'
+                })
+                return
+
+            event = to_event('POST', path, dict(self.headers), body)
+            self.send_lambda_response(handler(event, None))
+
+        def send_lambda_response(self, response: Dict):
+            body = response.get('body', '').encode('utf-8')
+            self.send_response(response['statusCode'])
+            for name, value in response.get('headers', {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # The handlers already print every event, skip logging every request line as well
+            pass
+
+    return LambdaRequestHandler
+
+
+class LocalServer(ThreadingHTTPServer):
+    """
+    Multi-threaded HTTP server serving the Lambda handlers, with the AWS clients replaced by the given stand-ins.
+
+    The handlers use the clients through class attributes of aws_client, so those are replaced for as long as the
+    server is open and restored when it is closed. Only one server can be open in a process at a time.
+    """
+
+    def __init__(self, address: Tuple[str, int], s3_client, ddb_resource):
+        aws_client, lambda_handler = import_handlers()
+        self.aws_client = aws_client
+        self.saved_clients = (aws_client.S3Client.s3_client, aws_client.DDBClient.ddb_client)
+        self.saved_environ = {name: os.environ.get(name) for name in ('TREE_BUCKET_NAME', 'DATA_TABLE_NAME')}
+
+        os.environ.setdefault('TREE_BUCKET_NAME', LOCAL_TREE_BUCKET_NAME)
+        os.environ.setdefault('DATA_TABLE_NAME', LOCAL_DATA_TABLE_NAME)
+        aws_client.S3Client.s3_client = s3_client
+        aws_client.DDBClient.ddb_client = ddb_resource
+
+        routes = {
+            '/retrieve': lambda_handler.handle_index,
+            '/tree': lambda_handler.handle_create,
+            '/trees': lambda_handler.handle_create_batch,
+        }
+        try:
+            super().__init__(address, make_handler(routes))
+        except Exception:
+            self.restore()
+            raise
+
+    def server_close(self):
+        super().server_close()
+        self.restore()
+
+    def restore(self):
+        """
+        Restores the AWS clients and environment variables replaced by the server.
+        """
+        self.aws_client.S3Client.s3_client, self.aws_client.DDBClient.ddb_client = self.saved_clients
+        for name, value in self.saved_environ.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def create_server(host: str, port: int, s3_client=None, ddb_resource=None) -> LocalServer:
+    """
+    Creates a multi-threaded HTTP server serving the Lambda handlers.
+    :param host: Host to bind to
+    :param port: Port to bind to, 0 to pick any free port
+    :param s3_client: Stand-in for the S3 client. In memory if not given.
+    :param ddb_resource: Stand-in for the DynamoDB resource. In memory if not given.
+    :return: Server, not yet started. Closing it restores the AWS clients.
+    """
+    default_s3_client, default_ddb_resource = create_stores()
+    s3_client = default_s3_client if s3_client is None else s3_client
+    ddb_resource = default_ddb_resource if ddb_resource is None else ddb_resource
+    return LocalServer((host, port), s3_client, ddb_resource)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Merkle Tree App API locally.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--data-dir', type=Path, default=None,
+                        help="Directory to persist trees and data in. Kept in memory if not given.")
+    parser.add_argument('--unprocessed-keys-ratio', type=float, default=0.0,
+                        help="Fraction of keys DynamoDB randomly returns as unprocessed, to exercise retries.")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, *create_stores(args.data_dir, args.unprocessed_keys_ratio))
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
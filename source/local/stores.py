@@ -0,0 +1,221 @@
+import io
+import json
+import random
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+
+def _client_error(code: str, message: str, operation_name: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': message}}, operation_name)
+
+
+def _no_such_key(operation_name: str, key: str) -> ClientError:
+    return _client_error('NoSuchKey', f"Key does not exist: {key}", operation_name)
+
+
+def _resolve_path(root: Path, *names: str) -> Optional[Path]:
+    """
+    Joins the given names onto root.
+    :return: Joined path, or None if it resolves outside root.
+    """
+    root = root.resolve()
+    path = root.joinpath(*names).resolve()
+    if path == root or root not in path.parents:
+        return None
+    return path
+
+
+class InMemoryS3Client:
+    """
+    Stand-in for the boto3 S3 client keeping objects in memory.
+    Supports only the operations used by aws_client.S3Client.
+    """
+
+    def __init__(self):
+        self.objects: Dict[str, Dict[str, bytes]] = {}
+        self.lock = threading.Lock()
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes):
+        with self.lock:
+            self.objects.setdefault(Bucket, {})[Key] = Body
+        return {}
+
+    def get_object(self, Bucket: str, Key: str):
+        with self.lock:
+            body = self.objects.get(Bucket, {}).get(Key)
+        if body is None:
+            raise _no_such_key('GetObject', Key)
+        return {'Body': io.BytesIO(body)}
+
+
+class FileSystemS3Client:
+    """
+    Stand-in for the boto3 S3 client keeping objects as files under <root>/<bucket>/<key>.
+    Supports only the operations used by aws_client.S3Client.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def object_path(self, Bucket: str, Key: str, operation_name: str) -> Path:
+        bucket_path = _resolve_path(self.root, Bucket)
+        path = _resolve_path(bucket_path, Key) if bucket_path is not None else None
+        if path is None:
+            raise _client_error('InvalidArgument', f"Key resolves outside the bucket: {Key}", operation_name)
+        return path
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes):
+        path = self.object_path(Bucket, Key, 'PutObject')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial object
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(Body)
+        tmp_path.replace(path)
+        return {}
+
+    def get_object(self, Bucket: str, Key: str):
+        path = self.object_path(Bucket, Key, 'GetObject')
+        if not path.is_file():
+            raise _no_such_key('GetObject', Key)
+        return {'Body': io.BytesIO(path.read_bytes())}
+
+
+class InMemoryTable:
+    """
+    Stand-in for a boto3 DynamoDB Table keeping items in memory, keyed by the given partition key.
+    """
+
+    def __init__(self, key_name: str):
+        self.key_name = key_name
+        self.items: Dict[str, Dict[str, str]] = {}
+        self.lock = threading.Lock()
+
+    def put_item(self, Item: Dict[str, str]):
+        with self.lock:
+            self.items[Item[self.key_name]] = Item
+        return {}
+
+    def get_item(self, key: str) -> Optional[Dict[str, str]]:
+        with self.lock:
+            return self.items.get(key)
+
+    def batch_writer(self):
+        return BatchWriter(self)
+
+
+class FileSystemTable:
+    """
+    Stand-in for a boto3 DynamoDB Table keeping each item as a JSON file under <root>/<key>.
+    """
+
+    def __init__(self, key_name: str, root: Path):
+        self.key_name = key_name
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def item_path(self, key: str, operation_name: str) -> Path:
+        path = _resolve_path(self.root, key)
+        if path is None:
+            raise _client_error('ValidationException', f"Key resolves outside the table: {key}", operation_name)
+        return path
+
+    def put_item(self, Item: Dict[str, str]):
+        path = self.item_path(Item[self.key_name], 'PutItem')
+        # Write to a temporary file first so concurrent readers never see a partial item
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(Item))
+        tmp_path.replace(path)
+        return {}
+
+    def get_item(self, key: str) -> Optional[Dict[str, str]]:
+        path = self.item_path(key, 'BatchGetItem')
+        if not path.is_file():
+            return None
+        return json.loads(path.read_text())
+
+    def batch_writer(self):
+        return BatchWriter(self)
+
+
+class BatchWriter:
+    """
+    Stand-in for a boto3 DynamoDB batch writer. Items are buffered and written when the context exits.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.items: List[Dict[str, str]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for item in self.items:
+            self.table.put_item(Item=item)
+        return False
+
+    def put_item(self, Item: Dict[str, str]):
+        self.items.append(Item)
+
+
+class DynamoDBResource:
+    """
+    Stand-in for the boto3 DynamoDB resource. Tables are kept in memory, or as directories under root if given.
+    Supports only the operations used by aws_client.DDBClient.
+
+    Same as the real service, batch_get_item rejects more than max_batch_get_keys keys or duplicated keys.
+    To exercise retries, unprocessed_keys_ratio of the requested keys are randomly returned as unprocessed.
+    """
+    max_batch_get_keys = 100
+
+    def __init__(self, key_name: str, root: Optional[Path] = None, unprocessed_keys_ratio: float = 0.0):
+        self.key_name = key_name
+        self.root = root
+        self.unprocessed_keys_ratio = unprocessed_keys_ratio
+        self.tables = {}
+        self.lock = threading.Lock()
+
+    def Table(self, name: str):
+        with self.lock:
+            if name not in self.tables:
+                if self.root is None:
+                    self.tables[name] = InMemoryTable(self.key_name)
+                else:
+                    table_path = _resolve_path(self.root, name)
+                    if table_path is None:
+                        raise _client_error('ValidationException', f"Invalid table name: {name}", 'DescribeTable')
+                    self.tables[name] = FileSystemTable(self.key_name, table_path)
+            return self.tables[name]
+
+    def batch_get_item(self, RequestItems: Dict[str, Dict[str, List[Dict[str, str]]]]):
+        total_keys = sum(len(request['Keys']) for request in RequestItems.values())
+        if total_keys > self.max_batch_get_keys:
+            raise _client_error('ValidationException',
+                                f"Too many items requested for the BatchGetItem call: {total_keys}", 'BatchGetItem')
+
+        responses = {}
+        unprocessed = {}
+        for table_name, request in RequestItems.items():
+            keys = [key[self.key_name] for key in request['Keys']]
+            if len(set(keys)) != len(keys):
+                raise _client_error('ValidationException', "Provided list of item keys contains duplicates",
+                                    'BatchGetItem')
+
+            table = self.Table(table_name)
+            items = []
+            unprocessed_keys = []
+            for key in request['Keys']:
+                if random.random() < self.unprocessed_keys_ratio:
+                    unprocessed_keys.append(key)
+                    continue
+                item = table.get_item(key[self.key_name])
+                if item is not None:
+                    items.append(item)
+
+            responses[table_name] = items
+            if len(unprocessed_keys) > 0:
+                unprocessed[table_name] = {'Keys': unprocessed_keys}
+        return {'Responses': responses, 'UnprocessedKeys': unprocessed}
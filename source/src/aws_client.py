@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 import boto3
 import pickle
@@ -9,6 +10,7 @@ from botocore.exceptions import ClientError
 
 class S3Client:
     s3_client = boto3.client('s3')
+    max_upload_workers = 8
 
     @classmethod
     def save_tree(cls, tree_id: str, data: List[List[str]]) -> bool:
@@ -27,6 +29,29 @@ class S3Client:
             return False
         return True
 
+    @classmethod
+    def save_trees(cls, trees: Dict[str, List[List[str]]]) -> Dict[str, bool]:
+        """
+        Save multiple trees in the S3 bucket, uploading them concurrently.
+        :param trees: {tree_id -> list of hashes} pairs to save
+        :return: {tree_id -> True if save is successful. False otherwise.}
+        """
+        if len(trees) == 0:
+            return {}
+
+        workers = min(cls.max_upload_workers, len(trees))
+        results: Dict[str, bool] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {tree_id: executor.submit(cls.save_tree, tree_id, data) for tree_id, data in trees.items()}
+            for tree_id, future in futures.items():
+                # A failure of one upload must not lose the results of the others
+                try:
+                    results[tree_id] = future.result()
+                except Exception as err:
+                    print(f"Error when saving tree {tree_id}: {err}")
+                    results[tree_id] = False
+        return results
+
     @classmethod
     def load_tree(cls, tree_id: str) -> List[List[str]]:
         """
@@ -50,6 +75,8 @@ class DDBClient:
     data_table_key = 'DataId'
     data_column_name = 'Data'
     max_batch_get_tries = 3
+    # Maximum number of keys DynamoDB accepts in a single batch_get_item call
+    max_batch_get_keys = 100
     sleep_timeout_sec = 1
 
     @classmethod
@@ -75,18 +102,28 @@ class DDBClient:
     @classmethod
     def load_data(cls, data_keys: List[str]) -> Dict[str, str]:
         """
-        Load data from dynamodb using given keys.
+        Load data from dynamodb using given keys, in batches of at most max_batch_get_keys keys.
         :param data_keys: Keys of items to query
         :return: {key -> value} pairs.
         """
+        result: Dict[str, str] = {}
+        for i in range(0, len(data_keys), cls.max_batch_get_keys):
+            result.update(cls.load_data_batch(data_keys[i:i + cls.max_batch_get_keys]))
+        return result
+
+    @classmethod
+    def load_data_batch(cls, data_keys: List[str]) -> Dict[str, str]:
+        """
+        Load data from dynamodb using given keys in a single batch, retrying unprocessed keys.
+        :param data_keys: Keys of items to query, at most max_batch_get_keys.
+        :return: {key -> value} pairs.
+        """
         data_table_name = os.environ['DATA_TABLE_NAME']
 
         tries = 0
         batch_keys = data_keys
         result: Dict[str, str] = {}
 
-        # TODO: Batch the keys of they are more than 100.
-
         while tries < cls.max_batch_get_tries and len(batch_keys) > 0:
 
             keys = {
@@ -95,6 +132,7 @@ class DDBClient:
                 }
             }
 
+            tries += 1
             try:
                 response = cls.ddb_client.batch_get_item(RequestItems=keys)
                 retrieved_items = response.get('Responses', {}).get(data_table_name, [])
@@ -104,12 +142,11 @@ class DDBClient:
                 for item in retrieved_items:
                     result[item['DataId']] = item['Data']
 
-                batch_keys = response.get('UnprocessedKeys', [])
+                unprocessed_keys = response.get('UnprocessedKeys', {}).get(data_table_name, {}).get('Keys', [])
+                batch_keys = [key[cls.data_table_key] for key in unprocessed_keys]
                 print(f"Unprocessed keys: {batch_keys}")
 
-                tries += 1
-
-                if tries < cls.max_batch_get_tries:
+                if len(batch_keys) > 0 and tries < cls.max_batch_get_tries:
                     print(f"Sleep 1 second before retrying.")
                     time.sleep(cls.sleep_timeout_sec)
 
@@ -65,3 +65,42 @@ def handle_create(event, context):
             'headers': {'Content-Type': 'text/plain'},
             'body': json.dumps(f'Failed to create a tree. {e}')
         }
+
+
+def handle_create_batch(event, context):
+    """
+    Creates a new tree for each of the data lists provided in the event body.
+    :param event: Lambda event containing request data.
+    :param context: Lambda context
+    :return: JSON response with tree id or error of each tree, in the order of the provided data lists.
+    """
+    print(f"Received {event}")
+
+    try:
+        body = json.loads(event['body'])
+        if not isinstance(body, dict):
+            raise ValueError("Request body must be a JSON object.")
+
+        results = MerkleTree.create_batch(body.get('datasets'))
+        print(f"Created {len(results)} new trees")
+
+        trees = [{'tree_id': tree.id} if tree is not None else {'error': error} for tree, error in results]
+        return {
+            'statusCode': 200,
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps({'trees': trees})
+        }
+    except ValueError as e:
+        print(f"Received invalid request while creating trees: {e}")
+        return {
+            'statusCode': 400,
+            'headers': {'Content-Type': 'text/plain'},
+            'body': json.dumps(f'Invalid request. {e}')
+        }
+    except Exception as e:
+        print(f"Received exception while creating trees: {e}")
+        return {
+            'statusCode': 500,
+            'headers': {'Content-Type': 'text/plain'},
+            'body': json.dumps(f'Failed to create trees. {e}')
+        }
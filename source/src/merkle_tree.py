@@ -1,6 +1,6 @@
 import hashlib
 import json
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from aws_client import DDBClient, S3Client
 
@@ -79,6 +79,8 @@ class MerkleLevel:
 
 
 class MerkleTree:
+    max_batch_trees = 100
+    max_batch_leaves = 10000
 
     def __init__(self, identifier: str, levels: List[MerkleLevel]):
         self.id = identifier
@@ -122,6 +124,72 @@ class MerkleTree:
         :return: A new instance of Merkle Tree.
         """
 
+        data_map = cls.hash_data(data)
+
+        # Save data in DynamoDB
+        DDBClient.save_data(data_map)
+
+        tree = cls.build_new(data_map)
+
+        # Save tree in S3
+        S3Client.save_tree(tree.id, tree.hashes_list())
+
+        return tree
+
+    @classmethod
+    def create_batch(cls, datasets: List[List[str]]) -> List[Tuple[Optional['MerkleTree'], Optional[str]]]:
+        """
+        Creates a new tree for each of the data lists provided. Leaves shared among the trees are persisted in
+        DynamoDB only once, in a single batch, and trees are persisted in S3 concurrently.
+        :param datasets: List of data lists (leaves), one per tree.
+        :return: List of (tree, error) pairs in the same order as datasets. Exactly one of the pair is set.
+        """
+        if not isinstance(datasets, list):
+            raise ValueError("Datasets must be a list of data lists.")
+
+        if len(datasets) > cls.max_batch_trees:
+            raise ValueError(f"Cannot create more than {cls.max_batch_trees} trees in a batch. "
+                             f"Given: {len(datasets)}")
+
+        total_leaves = sum(len(data) for data in datasets if isinstance(data, list))
+        if total_leaves > cls.max_batch_leaves:
+            raise ValueError(f"Cannot create trees with more than {cls.max_batch_leaves} leaves in a batch. "
+                             f"Given: {total_leaves}")
+
+        results: List[Tuple[Optional[MerkleTree], Optional[str]]] = []
+        shared_data_map: Dict[str, str] = {}
+
+        for data in datasets:
+            try:
+                data_map = cls.hash_data(data)
+                shared_data_map.update(data_map)
+                results.append((cls.build_new(data_map), None))
+            except ValueError as e:
+                results.append((None, f"Failed to create a tree. {e}"))
+
+        # Save data of all the trees in DynamoDB
+        if len(shared_data_map) > 0 and not DDBClient.save_data(shared_data_map):
+            return [(None, error or "Failed to save tree data.") for _, error in results]
+
+        # Save trees in S3
+        trees = {tree.id: tree.hashes_list() for tree, _ in results if tree is not None}
+        saved = S3Client.save_trees(trees)
+
+        for i, (tree, _) in enumerate(results):
+            if tree is not None and not saved.get(tree.id, False):
+                results[i] = (None, "Failed to save tree.")
+        return results
+
+    @staticmethod
+    def hash_data(data: List[str]) -> Dict[str, str]:
+        """
+        Hashes the data list provided, dropping duplicated items.
+        :param data: List of data (leaves)
+        :return: Dictionary of hash -> data, in the order of the data list.
+        """
+        if not isinstance(data, list) or not all(isinstance(datum, str) for datum in data):
+            raise ValueError("Data must be a list of strings.")
+
         if len(data) <= 0:
             raise ValueError("Data list must be non-empty.")
 
@@ -129,10 +197,15 @@ class MerkleTree:
         for datum in data:
             hash_val = HashLib.hash_str(datum)
             data_map[hash_val] = datum
+        return data_map
 
-        # Save data in DynamoDB
-        DDBClient.save_data(data_map)
-
+    @classmethod
+    def build_new(cls, data_map: Dict[str, str]):
+        """
+        Builds a new tree from the given data map without persisting it.
+        :param data_map: Dictionary of hash -> data of leaf nodes.
+        :return: A new instance of Merkle Tree.
+        """
         children = [MerkleLeafNode(hash_val, datum) for hash_val, datum in data_map.items()]
 
         if len(children) % 2 != 0:
@@ -159,12 +232,14 @@ class MerkleTree:
         # Since levels were created bottom-up, reverse iterate to put root node at the top
         levels = [MerkleLevel(i, nodes) for i, nodes in reversed(list(enumerate(level_nodes)))]
 
-        hashes_list = [list(map(lambda node: node.hash, level.nodes)) for level in levels]
-        # Save tree in S3
-        S3Client.save_tree(root_id, hashes_list)
-
         return cls(root_id, levels)
 
+    def hashes_list(self) -> List[List[str]]:
+        """
+        :return: List of list hashes of nodes in each level of the tree, from root to leaves.
+        """
+        return [list(map(lambda node: node.hash, level.nodes)) for level in self.levels]
+
     @classmethod
     def load_tree(cls, tree_id: str):
         """
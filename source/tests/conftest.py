@@ -0,0 +1,11 @@
+import os
+import sys
+from pathlib import Path
+
+# The Lambda source imports its siblings as top level modules, the same as in the Lambda runtime
+lambda_src_path = Path(__file__).resolve().parent.parent / "src"
+if str(lambda_src_path) not in sys.path:
+    sys.path.insert(0, str(lambda_src_path))
+
+# Region is only needed to create the boto3 clients at import time, tests never call AWS
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
@@ -0,0 +1,85 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from source.src.aws_client import DDBClient, S3Client
+
+
+class S3ClientTest(TestCase):
+
+    @patch.dict(os.environ, {'TREE_BUCKET_NAME': 'bucket'})
+    @patch.object(S3Client, 's3_client')
+    def test_save_trees_failure(self, s3_client_mock):
+        def put_object(Bucket, Key, Body):
+            if Key == 'unreachable':
+                raise EndpointConnectionError(endpoint_url='https://s3.amazonaws.com')
+            return {}
+
+        s3_client_mock.put_object.side_effect = put_object
+
+        saved = S3Client.save_trees({'tree': [["hash"]], 'unreachable': [["hash"]]})
+        self.assertEqual(saved, {'tree': True, 'unreachable': False}, "Expected a result for every tree.")
+
+
+class FakeDynamoDBResource:
+    """
+    Returns the first requested key as unprocessed for the first unprocessed_calls calls.
+    """
+
+    def __init__(self, unprocessed_calls=0, error=None):
+        self.unprocessed_calls = unprocessed_calls
+        self.error = error
+        self.requested_keys = []
+
+    def batch_get_item(self, RequestItems):
+        keys = RequestItems['table']['Keys']
+        self.requested_keys.append([key['DataId'] for key in keys])
+        if self.error is not None:
+            raise self.error
+
+        unprocessed = keys[:1] if len(self.requested_keys) <= self.unprocessed_calls else []
+        items = [{'DataId': key['DataId'], 'Data': f"data-{key['DataId']}"} for key in keys[len(unprocessed):]]
+        return {'Responses': {'table': items},
+                'UnprocessedKeys': {'table': {'Keys': unprocessed}} if len(unprocessed) > 0 else {}}
+
+
+@patch.dict(os.environ, {'DATA_TABLE_NAME': 'table'})
+@patch.object(DDBClient, 'sleep_timeout_sec', 0)
+class DDBClientTest(TestCase):
+
+    def test_load_data_retries_unprocessed_keys(self):
+        fake = FakeDynamoDBResource(unprocessed_calls=1)
+        with patch.object(DDBClient, 'ddb_client', fake):
+            result = DDBClient.load_data(['a', 'b', 'c'])
+
+        self.assertEqual(fake.requested_keys, [['a', 'b', 'c'], ['a']], "Expected unprocessed keys to be retried.")
+        self.assertEqual(result, {'a': 'data-a', 'b': 'data-b', 'c': 'data-c'}, "Expected all keys to be merged.")
+
+    def test_load_data_stops_retrying_unprocessed_keys(self):
+        fake = FakeDynamoDBResource(unprocessed_calls=DDBClient.max_batch_get_tries + 1)
+        with patch.object(DDBClient, 'ddb_client', fake):
+            result = DDBClient.load_data(['a', 'b', 'c'])
+
+        self.assertEqual(len(fake.requested_keys), DDBClient.max_batch_get_tries, "Expected retries to be bounded.")
+        self.assertEqual(result, {'b': 'data-b', 'c': 'data-c'}, "Expected processed keys to be merged.")
+
+    def test_load_data_stops_on_client_error(self):
+        error = ClientError({'Error': {'Code': 'ValidationException', 'Message': "Invalid"}}, 'BatchGetItem')
+        fake = FakeDynamoDBResource(error=error)
+        with patch.object(DDBClient, 'ddb_client', fake):
+            result = DDBClient.load_data(['a'])
+
+        self.assertEqual(len(fake.requested_keys), DDBClient.max_batch_get_tries, "Expected retries to be bounded.")
+        self.assertEqual(result, {}, "Expected no data.")
+
+    def test_load_data_batches_keys(self):
+        keys = [str(i) for i in range(DDBClient.max_batch_get_keys * 2 + 1)]
+        fake = FakeDynamoDBResource()
+        with patch.object(DDBClient, 'ddb_client', fake):
+            result = DDBClient.load_data(keys)
+
+        self.assertEqual([len(batch) for batch in fake.requested_keys],
+                         [DDBClient.max_batch_get_keys, DDBClient.max_batch_get_keys, 1], "Batch sizes did not match.")
+        self.assertEqual(len(result), len(keys), "Expected all keys to be loaded.")
@@ -0,0 +1,44 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from source.src.lambda_handler import handle_create_batch
+from source.src.merkle_tree import MerkleTree
+
+
+class LambdaHandlerTest(TestCase):
+
+    @staticmethod
+    def create_batch(body):
+        return handle_create_batch({'body': json.dumps(body)}, None)
+
+    @patch('source.src.merkle_tree.DDBClient.save_data')
+    @patch('source.src.merkle_tree.S3Client.save_trees')
+    def test_create_batch_invalid_request(self, s3_save_trees_mock, ddb_save_data_mock):
+        invalid_bodies = [
+            {},
+            {'datasets': None},
+            {'datasets': 5},
+            [["7", "8"]],
+            {'datasets': [["7"]] * (MerkleTree.max_batch_trees + 1)},
+            {'datasets': [["7"] * (MerkleTree.max_batch_leaves + 1)]},
+        ]
+        for body in invalid_bodies:
+            response = self.create_batch(body)
+            self.assertEqual(response['statusCode'], 400, f"Expected bad request for: {str(body)[:50]}")
+
+        ddb_save_data_mock.assert_not_called()
+        s3_save_trees_mock.assert_not_called()
+
+    @patch('source.src.merkle_tree.DDBClient.save_data')
+    @patch('source.src.merkle_tree.S3Client.save_trees')
+    def test_create_batch(self, s3_save_trees_mock, ddb_save_data_mock):
+        ddb_save_data_mock.return_value = True
+        s3_save_trees_mock.side_effect = lambda trees: {tree_id: True for tree_id in trees}
+
+        response = self.create_batch({'datasets': [["7", "8", "9", "10", "11", "12", "13", "14"], []]})
+        self.assertEqual(response['statusCode'], 200, "Trees must be created.")
+
+        trees = json.loads(response['body'])['trees']
+        self.assertEqual(trees[0], {'tree_id': "bf57020a599b6ca72c29faca759d2f5c782b0fd1b611ed529e0ea422c28daf36"})
+        self.assertIn('error', trees[1], "Expected an error for empty data.")
@@ -0,0 +1,84 @@
+import threading
+from unittest import TestCase
+
+from source.local.load_generator import LatencyStats, LoadGenerator
+from source.local.server import create_server
+
+
+class LatencyStatsTest(TestCase):
+
+    def test_percentile(self):
+        values = [float(i) for i in range(1, 101)]
+        self.assertEqual(LatencyStats.percentile(values, 50), 50.0, "p50 did not match.")
+        self.assertEqual(LatencyStats.percentile(values, 90), 90.0, "p90 did not match.")
+        self.assertEqual(LatencyStats.percentile(values, 99), 99.0, "p99 did not match.")
+        self.assertEqual(LatencyStats.percentile(values, 100), 100.0, "p100 did not match.")
+        self.assertEqual(LatencyStats.percentile([7.0], 50), 7.0, "Single value percentile did not match.")
+        self.assertEqual(LatencyStats.percentile([1.0, 2.0], 1), 1.0, "Lowest rank must be the first value.")
+        self.assertEqual(LatencyStats.percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50), 3.0, "p50 of 5 did not match.")
+        self.assertEqual(LatencyStats.percentile([float(i) for i in range(1, 8)], 90), 7.0, "p90 of 7 did not match.")
+        self.assertEqual(LatencyStats.percentile([float(i) for i in range(1, 151)], 99), 149.0,
+                         "p99 of 150 did not match.")
+
+    def test_report(self):
+        stats = LatencyStats()
+        for i in range(1, 11):
+            stats.record('create', i / 1000, True)
+        stats.record('retrieve', 0.5, False)
+
+        lines = stats.report(elapsed_sec=2).splitlines()
+        self.assertEqual(len(lines), 4, "Expected header, one row per operation and a total row.")
+
+        create = lines[1].split()
+        self.assertEqual(create[:4], ['create', '10', '0', '5.0'], "Count, errors or throughput did not match.")
+        self.assertEqual(create[4:], ['5.0', '9.0', '10.0', '10.0'], "Latency percentiles did not match.")
+
+        retrieve = lines[2].split()
+        self.assertEqual(retrieve[:3], ['retrieve', '1', '1'], "Count or errors did not match.")
+
+        total = lines[3].split()
+        self.assertEqual(total[:4], ['total', '11', '1', '5.5'], "Total row did not match.")
+        self.assertEqual(total[-1], '500.0', "Total max latency did not match.")
+
+
+class LoadGeneratorTest(TestCase):
+
+    def start_server(self):
+        server = create_server('127.0.0.1', 0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    @staticmethod
+    def generator(url, qps=50, duration_sec=1, create_ratio=0.3, batch_ratio=0.1):
+        return LoadGenerator(url, qps, duration_sec, create_ratio, batch_ratio, batch_size=3, leaves=16,
+                             leaf_pool=50, workers=8, timeout_sec=10)
+
+    def test_pick_operation(self):
+        generator = self.generator("http://unused", create_ratio=0, batch_ratio=0)
+        self.assertEqual(generator.pick_operation(), 'create', "Expected create until a tree exists.")
+
+        generator.add_tree("tree", ["7"])
+        self.assertEqual({generator.pick_operation() for _ in range(100)}, {'retrieve'})
+
+        generator.create_ratio = 1
+        self.assertEqual({generator.pick_operation() for _ in range(100)}, {'create'})
+
+        generator.create_ratio = 0
+        generator.batch_ratio = 1
+        self.assertEqual({generator.pick_operation() for _ in range(100)}, {'create_batch'})
+
+    def test_run(self):
+        generator = self.generator(self.start_server())
+        elapsed_sec = generator.run()
+
+        self.assertEqual(generator.sent, 50, "Expected target rate times duration requests to be sent.")
+        self.assertGreaterEqual(elapsed_sec, 0.98, "Run must last for the configured duration.")
+
+        latencies = generator.stats.latencies
+        self.assertEqual(sum(len(values) for values in latencies.values()), generator.sent,
+                         "Expected a latency for every request sent.")
+        self.assertEqual(sum(generator.stats.errors.values()), 0, "Expected no errors.")
+        self.assertGreater(len(latencies.get('retrieve', [])), 0, "Expected retrieve requests.")
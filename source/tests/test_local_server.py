@@ -0,0 +1,138 @@
+import http.client
+import json
+import os
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest import TestCase
+
+from botocore.exceptions import ClientError
+
+from source.local.server import create_server, create_stores, import_handlers
+from source.local.stores import DynamoDBResource, FileSystemS3Client
+
+
+class LocalServerTest(TestCase):
+    demo_tree_id = "bf57020a599b6ca72c29faca759d2f5c782b0fd1b611ed529e0ea422c28daf36"
+    demo_data = ["7", "8", "9", "10", "11", "12", "13", "14"]
+
+    def start_server(self, data_dir=None):
+        server = create_server('127.0.0.1', 0, *create_stores(data_dir))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    @staticmethod
+    def post(url, payload):
+        request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'), method='POST')
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+
+    def test_create_and_retrieve(self):
+        url = self.start_server()
+
+        status, response = self.post(f"{url}/tree", {'data': self.demo_data})
+        self.assertEqual(status, 200, "Tree must be created.")
+        self.assertEqual(response['tree_id'], self.demo_tree_id, "Tree id did not match.")
+
+        status, response = self.post(f"{url}/retrieve", {'tree_id': self.demo_tree_id, 'index': 7})
+        self.assertEqual(status, 200, "Node must be retrieved.")
+        self.assertEqual(response, {'depth': 3, 'offset': 0, 'value': "7"}, "Node did not match.")
+
+        status, response = self.post(f"{url}/trees", {'datasets': [self.demo_data, []]})
+        self.assertEqual(status, 200, "Trees must be created.")
+        self.assertEqual(response['trees'][0], {'tree_id': self.demo_tree_id}, "Tree id did not match.")
+        self.assertIn('error', response['trees'][1], "Expected an error for empty data.")
+
+    def test_retrieve_large_tree(self):
+        url = self.start_server()
+        data = [str(i) for i in range(250)]
+
+        status, response = self.post(f"{url}/tree", {'data': data})
+        self.assertEqual(status, 200, "Tree must be created.")
+
+        # The tree has 503 nodes, and the last leaf is the last node
+        status, response = self.post(f"{url}/retrieve", {'tree_id': response['tree_id'], 'index': 502})
+        self.assertEqual(status, 200, "Node must be retrieved from a tree with more than 100 leaves.")
+        self.assertEqual(response['value'], "249", "Node did not match.")
+
+    def test_create_and_retrieve_file_system(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            url = self.start_server(Path(data_dir))
+            self.post(f"{url}/tree", {'data': self.demo_data})
+
+            status, response = self.post(f"{url}/retrieve", {'tree_id': self.demo_tree_id, 'index': 0})
+            self.assertEqual(status, 200, "Node must be retrieved.")
+            self.assertEqual(response['value'], self.demo_tree_id, "Root hash did not match.")
+
+    def test_unknown_route(self):
+        url = self.start_server()
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.post(f"{url}/unknown", {})
+        self.assertEqual(context.exception.code, 404, "Expected not found for unknown route.")
+
+    def test_unknown_route_keep_alive(self):
+        url = self.start_server()
+        connection = http.client.HTTPConnection(url[len("http://"):])
+        self.addCleanup(connection.close)
+
+        connection.request('POST', '/unknown', body=json.dumps({'data': ["x"]}))
+        response = connection.getresponse()
+        response.read()
+        self.assertEqual(response.status, 404, "Expected not found for unknown route.")
+
+        # The body of the previous request must not be parsed as part of the next request on the same connection
+        connection.request('POST', '/tree', body=json.dumps({'data': self.demo_data}))
+        response = connection.getresponse()
+        self.assertEqual(response.status, 200, "Tree must be created on the same connection.")
+        self.assertEqual(json.loads(response.read())['tree_id'], self.demo_tree_id, "Tree id did not match.")
+
+    def test_server_close_restores_clients(self):
+        aws_client, _ = import_handlers()
+        s3_client = aws_client.S3Client.s3_client
+        ddb_client = aws_client.DDBClient.ddb_client
+        environ = dict(os.environ)
+
+        server = create_server('127.0.0.1', 0)
+        self.assertIsNot(aws_client.S3Client.s3_client, s3_client, "S3 client must be replaced while open.")
+        server.server_close()
+
+        self.assertIs(aws_client.S3Client.s3_client, s3_client, "S3 client must be restored.")
+        self.assertIs(aws_client.DDBClient.ddb_client, ddb_client, "DynamoDB client must be restored.")
+        self.assertEqual(dict(os.environ), environ, "Environment must be restored.")
+
+    def test_file_system_rejects_keys_outside_root(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            root = Path(data_dir) / 'root'
+            (Path(data_dir) / 'secret').write_bytes(b"secret")
+            s3_client = FileSystemS3Client(root)
+
+            with self.assertRaises(ClientError):
+                s3_client.get_object(Bucket='bucket', Key='../../secret')
+            with self.assertRaises(ClientError):
+                s3_client.put_object(Bucket='bucket', Key='../../secret', Body=b"data")
+            self.assertEqual((Path(data_dir) / 'secret').read_bytes(), b"secret", "File must not be changed.")
+
+    def test_batch_get_item_limits(self):
+        ddb_resource = DynamoDBResource('DataId')
+        table = ddb_resource.Table('table')
+        for i in range(DynamoDBResource.max_batch_get_keys + 1):
+            table.put_item(Item={'DataId': str(i), 'Data': str(i)})
+
+        keys = [{'DataId': str(i)} for i in range(DynamoDBResource.max_batch_get_keys + 1)]
+        with self.assertRaises(ClientError) as context:
+            ddb_resource.batch_get_item(RequestItems={'table': {'Keys': keys}})
+        self.assertEqual(context.exception.response['Error']['Code'], 'ValidationException')
+
+        response = ddb_resource.batch_get_item(RequestItems={'table': {'Keys': keys[:-1]}})
+        self.assertEqual(len(response['Responses']['table']), DynamoDBResource.max_batch_get_keys)
+        self.assertEqual(response['UnprocessedKeys'], {}, "Expected all keys to be processed.")
+
+        ddb_resource.unprocessed_keys_ratio = 1.0
+        response = ddb_resource.batch_get_item(RequestItems={'table': {'Keys': keys[:2]}})
+        self.assertEqual(response['Responses']['table'], [], "Expected no keys to be processed.")
+        self.assertEqual(response['UnprocessedKeys'], {'table': {'Keys': keys[:2]}})
@@ -54,8 +54,8 @@ class MerkleTreeTest(TestCase):
          "4523540f1504cd17100c4835e85b7eefd49911580f8efff0599a8f283be6b9e3",
          "4523540f1504cd17100c4835e85b7eefd49911580f8efff0599a8f283be6b9e3"]]  # Depth 4
 
-    @patch('source.src.aws_client.DDBClient.save_data')
-    @patch('source.src.aws_client.S3Client.save_tree')
+    @patch('source.src.merkle_tree.DDBClient.save_data')
+    @patch('source.src.merkle_tree.S3Client.save_tree')
     def test_create_new(self, s3_save_tree_mock, ddb_save_data_mock):
         ddb_save_data_mock.return_value = True
         s3_save_tree_mock.return_value = True
@@ -76,8 +76,83 @@ class MerkleTreeTest(TestCase):
         self.assertEqual(len(odd_tree.levels), 5, "Tree depth does not match.")
         self.assertEqual(odd_tree.size, 25, "Tree size does not match.")
 
-    @patch('source.src.aws_client.DDBClient.load_data')
-    @patch('source.src.aws_client.S3Client.load_tree')
+    @patch('source.src.merkle_tree.DDBClient.save_data')
+    @patch('source.src.merkle_tree.S3Client.save_trees')
+    def test_create_batch(self, s3_save_trees_mock, ddb_save_data_mock):
+        ddb_save_data_mock.return_value = True
+        s3_save_trees_mock.side_effect = lambda trees: {tree_id: True for tree_id in trees}
+
+        results = MerkleTree.create_batch([self.test_data_even, [], self.test_data_odd])
+        self.assertEqual(len(results), 3, "Expected a result for every data list.")
+
+        even_tree, even_error = results[0]
+        self.assertIsNone(even_error, "Even tree must be created.")
+        self.assertEqual(even_tree.id, self.test_data_even_hashes[0][0], "Tree id did not match.")
+
+        empty_tree, empty_error = results[1]
+        self.assertIsNone(empty_tree, "Tree must not be created for empty data.")
+        self.assertIsNotNone(empty_error, "Expected an error for empty data.")
+
+        odd_tree, odd_error = results[2]
+        self.assertIsNone(odd_error, "Odd tree must be created.")
+        self.assertEqual(odd_tree.id, self.test_data_odd_hashes[0][0], "Tree id did not match.")
+
+        # Leaves shared among the trees are saved once, in a single call
+        ddb_save_data_mock.assert_called_once()
+        saved_data_map = ddb_save_data_mock.call_args[0][0]
+        self.assertEqual(len(saved_data_map), len(set(self.test_data_even + self.test_data_odd)),
+                         "Shared leaves must be saved once.")
+
+        s3_save_trees_mock.assert_called_once()
+        saved_trees = s3_save_trees_mock.call_args[0][0]
+        self.assertEqual(saved_trees[even_tree.id], self.test_data_even_hashes, "Hashes does not match.")
+        self.assertEqual(saved_trees[odd_tree.id], self.test_data_odd_hashes, "Hashes does not match.")
+
+    @patch('source.src.merkle_tree.DDBClient.save_data')
+    @patch('source.src.merkle_tree.S3Client.save_trees')
+    def test_create_batch_save_failure(self, s3_save_trees_mock, ddb_save_data_mock):
+        ddb_save_data_mock.return_value = True
+        s3_save_trees_mock.side_effect = lambda trees: {tree_id: tree_id != self.test_data_odd_hashes[0][0]
+                                                        for tree_id in trees}
+
+        results = MerkleTree.create_batch([self.test_data_even, self.test_data_odd])
+        self.assertIsNotNone(results[0][0], "Even tree must be created.")
+        self.assertIsNone(results[1][0], "Odd tree must fail when it is not saved.")
+        self.assertIsNotNone(results[1][1], "Expected an error for the unsaved tree.")
+
+        ddb_save_data_mock.return_value = False
+        results = MerkleTree.create_batch([self.test_data_even, self.test_data_odd])
+        self.assertTrue(all(tree is None for tree, _ in results), "Trees must fail when data is not saved.")
+
+    @patch('source.src.merkle_tree.DDBClient.save_data')
+    @patch('source.src.merkle_tree.S3Client.save_trees')
+    def test_create_batch_invalid_data(self, s3_save_trees_mock, ddb_save_data_mock):
+        ddb_save_data_mock.return_value = True
+        s3_save_trees_mock.side_effect = lambda trees: {tree_id: True for tree_id in trees}
+
+        results = MerkleTree.create_batch([self.test_data_even, [1, 2], None, "7"])
+        self.assertEqual(results[0][0].id, self.test_data_even_hashes[0][0], "Valid tree must be created.")
+        for tree, error in results[1:]:
+            self.assertIsNone(tree, "Tree must not be created for invalid data.")
+            self.assertIsNotNone(error, "Expected an error for invalid data.")
+
+    @patch('source.src.merkle_tree.DDBClient.save_data')
+    @patch('source.src.merkle_tree.S3Client.save_trees')
+    def test_create_batch_limits(self, s3_save_trees_mock, ddb_save_data_mock):
+        with self.assertRaises(ValueError):
+            MerkleTree.create_batch([["7"]] * (MerkleTree.max_batch_trees + 1))
+
+        with self.assertRaises(ValueError):
+            MerkleTree.create_batch([["7"] * (MerkleTree.max_batch_leaves + 1)])
+
+        with self.assertRaises(ValueError):
+            MerkleTree.create_batch(None)
+
+        ddb_save_data_mock.assert_not_called()
+        s3_save_trees_mock.assert_not_called()
+
+    @patch('source.src.merkle_tree.DDBClient.load_data')
+    @patch('source.src.merkle_tree.S3Client.load_tree')
     def test_load_tree_even(self, s3_load_tree_mock, ddb_load_data_mock):
         s3_load_tree_mock.return_value = self.test_data_even_hashes
 
@@ -93,8 +168,8 @@ class MerkleTreeTest(TestCase):
         even_hashes = [list(map(lambda node: node.hash, level.nodes)) for level in even_tree.levels]
         self.assertEqual(even_hashes, self.test_data_even_hashes, "Hashes does not match.")
 
-    @patch('source.src.aws_client.DDBClient.load_data')
-    @patch('source.src.aws_client.S3Client.load_tree')
+    @patch('source.src.merkle_tree.DDBClient.load_data')
+    @patch('source.src.merkle_tree.S3Client.load_tree')
     def test_load_tree_odd(self, s3_load_tree_mock, ddb_load_data_mock):
         s3_load_tree_mock.return_value = self.test_data_odd_hashes
 
@@ -110,8 +185,8 @@ class MerkleTreeTest(TestCase):
         even_hashes = [list(map(lambda node: node.hash, level.nodes)) for level in even_tree.levels]
         self.assertEqual(even_hashes, self.test_data_odd_hashes, "Hashes does not match.")
 
-    @patch('source.src.aws_client.DDBClient.save_data')
-    @patch('source.src.aws_client.S3Client.save_tree')
+    @patch('source.src.merkle_tree.DDBClient.save_data')
+    @patch('source.src.merkle_tree.S3Client.save_tree')
     def test_index(self, s3_save_tree_mock, ddb_save_data_mock):
         even_tree = MerkleTree.create_new(self.test_data_even)
         for i in range(0, even_tree.size):